@@ -1,8 +1,13 @@
+from dataclasses import replace
+from functools import lru_cache, partial
 import logging
+import math
 import re
 from typing import Callable, Union, Optional
 from pathlib import Path
 
+import anyio
+
 from ...core.context import Context
 from ...core.dataset_item import DatasetItem
 from ...core.key import Key
@@ -18,8 +23,22 @@ from ...utils.docker.sandbox_runner import SandboxResult, SandboxRunner
 logger = logging.getLogger(__name__)
 
 SETUP_START = "::setup:start::"
+SETUP_END_PREFIX = "::setup:end:"
+SETUP_END_SUFFIX = "::"
 SETUP_END_PATTERN = re.compile(r"::setup:end:(\d+)::")
 
+# Shared by all sandboxed test runs so `max_concurrent_sandboxes` limits sandboxes across all items
+_sandbox_limiter = anyio.CapacityLimiter(math.inf)
+
+
+@lru_cache(maxsize=32)
+def _get_sandbox_runner(sandbox_name: str) -> SandboxRunner:
+    """
+    Get the sandbox runner for a sandbox, creating it the first time the sandbox is used so the
+    Docker client and sandbox configuration are shared across all items using that sandbox.
+    """
+    return SandboxRunner(sandbox_name)
+
 
 def run_unit_tests(
         filename: Union[Callable,Key,str],
@@ -31,44 +50,65 @@ def run_unit_tests(
         stream_logs: Union[Callable,Key,bool] = False,
         timeout: Union[Callable,Key,int] = 300,
     ) -> ItemAction:
+    # Resolvers for the parameters of each item, in order, with the parameter values pre-bound
+    resolvers = (
+        partial(resolve_item_value, filename, required_as="filename"),
+        partial(resolve_item_value, dir, required_as="dir"),
+        partial(resolve_item_value, property, required_as="property"),
+        partial(resolve_item_value, setup_property),
+        partial(resolve_item_value, sandbox),
+        partial(resolve_item_value, test_plugins_dir),
+        partial(resolve_item_value, stream_logs),
+        partial(resolve_item_value, timeout),
+    )
+
+    # Plain string filenames resolve to themselves, so the sandbox command can be built up front
+    constant_command = _pytest_command(filename) if isinstance(filename, str) else None
+
     async def run_unit_tests_action(item: DatasetItem, context: Context):
-        resolved_filename = resolve_item_value(filename, item, context, required_as="filename")
-        resolved_dir = resolve_item_value(dir, item, context, required_as="dir")
-        resolved_property = resolve_item_value(property, item, context, required_as="property")
-        resolved_setup_property = resolve_item_value(setup_property, item, context)
-        resolved_sandbox = resolve_item_value(sandbox, item, context)
-        resolved_test_plugins_dir = resolve_item_value(test_plugins_dir, item, context)
-        resolved_stream_logs = resolve_item_value(stream_logs, item, context)
-        resolved_timeout = resolve_item_value(timeout, item, context)
+        (
+            resolved_filename,
+            resolved_dir,
+            resolved_property,
+            resolved_setup_property,
+            resolved_sandbox,
+            resolved_test_plugins_dir,
+            resolved_stream_logs,
+            resolved_timeout,
+        ) = [resolve(item, context) for resolve in resolvers]
+        setup_result = None
 
         if resolved_sandbox:
             if isinstance(resolved_sandbox, str):
-                sandbox_manager = SandboxRunner(resolved_sandbox)
+                sandbox_manager = _get_sandbox_runner(resolved_sandbox)
             else:
                 raise ValueError("Sandbox must be a string name of a sandbox")
 
             if isinstance(resolved_test_plugins_dir, str):
                 resolved_test_plugins_dir = Path(resolved_test_plugins_dir)
 
-            command = [f"python -m pytest -v '{resolved_filename}'"]
+            command = constant_command or _pytest_command(resolved_filename)
 
-            logger.info(f"Running tests in sandbox with command: {' '.join(command)}")
-            sandbox_result = await sandbox_manager.run(
-                target_file=resolved_filename,
-                workspace_dir=resolved_dir,
-                test_plugins_dir=resolved_test_plugins_dir,
-                command=command,
-                timeout=resolved_timeout,
-                stream_logs=resolved_stream_logs
-            )
+            max_concurrent_sandboxes = context.params.get("max_concurrent_sandboxes")
+            _sandbox_limiter.total_tokens = max_concurrent_sandboxes or math.inf
+
+            async with _sandbox_limiter:
+                logger.info(f"Running tests in sandbox with command: {' '.join(command)}")
+                sandbox_result = await sandbox_manager.run(
+                    target_file=resolved_filename,
+                    workspace_dir=resolved_dir,
+                    test_plugins_dir=resolved_test_plugins_dir,
+                    command=command,
+                    timeout=resolved_timeout,
+                    stream_logs=resolved_stream_logs
+                )
             pytest_result, setup_result = _parse_sandbox_result(sandbox_result)
 
             if pytest_result.returncode is not None:
                 sandbox_result.stdout = pytest_result.stdout
                 sandbox_result.stderr = pytest_result.stderr
 
-                result = parse_python_unit_test_results(sandbox_result)
-                result.command = command
+                result = replace(parse_python_unit_test_results(sandbox_result), command=command)
             else:
                 result = UnitTestResult(
                     command=command,
@@ -90,14 +130,41 @@ def run_unit_tests(
     return run_unit_tests_action
 
 
-def _parse_sandbox_result(sandbox_result: SandboxResult) -> tuple[CommandResult, CommandResult]:
+def _pytest_command(filename: str) -> list[str]:
+    return [f"python -m pytest -v '{filename}'"]
+
+
+def _parse_sandbox_result(
+        sandbox_result: SandboxResult,
+    ) -> tuple[CommandResult, Optional[CommandResult]]:
     """
     Parse sandbox result into pytest and setup command results.
 
     Looks for ::setup:start:: and ::setup:end:N:: in stdout and stderr. Content between those
     markers is the setup result; everything after the end marker is treated as pytest output. If no
-    setup markers are present, setup is empty/success and all output is pytest.
+    setup markers are present, all output is pytest and no setup result is returned.
+
+    The output is split after the sandbox exits rather than as it streams, since the container
+    manager only returns each stream once the container has finished, and the full pytest output is
+    kept on the resulting `UnitTestResult` regardless.
     """
+    stdout = sandbox_result.stdout
+    stderr = sandbox_result.stderr
+
+    if SETUP_START not in stdout and SETUP_START not in stderr:
+        pytest_stdout = stdout.strip("\n")
+        pytest_stderr = stderr.strip("\n")
+
+        # Without any pytest output, fall through so this is reported as pytest never having run
+        if pytest_stdout or pytest_stderr:
+            pytest_result = CommandResult(
+                command=[],
+                returncode=sandbox_result.exit_code,
+                stdout=pytest_stdout,
+                stderr=pytest_stderr,
+            )
+            return pytest_result, None
+
     pytest_stdout, setup_stdout, setup_stdout_code = _split_stream(sandbox_result.stdout)
     pytest_stderr, setup_stderr, setup_stderr_code = _split_stream(sandbox_result.stderr)
 
@@ -140,13 +207,64 @@ def _split_stream(output: str) -> tuple[str, str, Optional[int]]:
         # No start marker: treat all output as pytest content
         return output.strip("\n"), "", None
 
-    content_after_start = output[start_idx + len(SETUP_START) :]
-    end_match = SETUP_END_PATTERN.search(content_after_start)
-    if not end_match:
+    # Search from an offset rather than slicing so large outputs aren't copied just to be scanned
+    content_start = start_idx + len(SETUP_START)
+    end_marker = _find_setup_end(output, content_start)
+    if not end_marker:
         # Start marker present but no end marker: treat everything after start as setup content
-        return "", content_after_start.strip("\n"), -1
+        return "", _trim_newlines(output, content_start, len(output)), -1
+
+    end_start, end_end, setup_code = end_marker
+    setup_content = _trim_newlines(output, content_start, end_start)
+    pytest_content = _trim_newlines(output, end_end, len(output))
+
+    return pytest_content, setup_content, setup_code
+
+
+def _find_setup_end(output: str, pos: int) -> Optional[tuple[int, int, int]]:
+    """
+    Find the first setup end marker in the output at or after `pos`.
+
+    Uses plain string searches for the common well-formed marker, falling back to
+    `SETUP_END_PATTERN` if the first marker found is malformed.
+
+    Args:
+        output: The output to search
+        pos: The index in the output to start searching from
+
+    Returns:
+        A tuple containing the start and end index of the marker and the setup exit code, or `None`
+        if no end marker was found
+    """
+    marker_start = output.find(SETUP_END_PREFIX, pos)
+    if marker_start == -1:
+        return None
+
+    code_start = marker_start + len(SETUP_END_PREFIX)
+    code_end = output.find(SETUP_END_SUFFIX, code_start)
+    code = output[code_start:code_end] if code_end != -1 else ""
+
+    if code.isdecimal():
+        return marker_start, code_end + len(SETUP_END_SUFFIX), int(code)
+
+    end_match = SETUP_END_PATTERN.search(output, marker_start)
+    if not end_match:
+        return None
+
+    return end_match.start(), end_match.end(), int(end_match.group(1))
+
+
+def _trim_newlines(output: str, start: int, end: int) -> str:
+    """
+    Return `output[start:end]` with leading and trailing newlines removed.
+
+    Equivalent to `output[start:end].strip("\n")`, but adjusts the offsets before slicing so only a
+    single copy of the section is made.
+    """
+    while start < end and output[start] == "\n":
+        start += 1
 
-    setup_content = content_after_start[: end_match.start()].strip("\n")
-    pytest_content = content_after_start[end_match.end() :].strip("\n")
+    while end > start and output[end - 1] == "\n":
+        end -= 1
 
-    return pytest_content, setup_content, int(end_match.group(1))
+    return output[start:end]
@@ -125,6 +125,13 @@ async def main_cli():
         default=DEFAULT_MAX_CONCURRENT_ITEMS,
         help=f"Maximum number of items to process concurrently"
     )
+    parser.add_argument(
+        "--max-sandboxes",
+        type=int,
+        env="DF_MAX_SANDBOXES",
+        default=None,
+        help=f"Maximum number of sandboxes to run concurrently (default: no limit beyond --max-items)"
+    )
     parser.add_argument(
         "-P",
         action="append",
@@ -151,6 +158,7 @@ async def main_cli():
 
     pipeline_parameters = {
         "max_concurrent_items": args["max_items"],
+        "max_concurrent_sandboxes": args["max_sandboxes"],
     }
     parameter_list = args.pop("pipeline_parameters", []) or []
     for param_dict in parameter_list:
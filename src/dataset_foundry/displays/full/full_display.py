@@ -12,6 +12,9 @@ class FullDisplay(Display):
         Run the given pipeline inside the FullDisplayApp, relying on Textual's
         own lifecycle management (workers, timers, shutdown) rather than
         juggling asyncio tasks externally.
+
+        If the `_headless` parameter is set, the app runs without a terminal, which is useful when
+        testing the app lifecycle without rendering the UI.
         """
         app = FullDisplayApp(pipeline=pipeline, params=params)
-        await app.run_async()
+        await app.run_async(headless=params.get("_headless", False))
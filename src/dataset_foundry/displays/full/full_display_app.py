@@ -16,6 +16,9 @@ from .widgets.item_tabs import ItemTabs
 
 logger = logging.getLogger(__name__)
 
+# How often captured prints are flushed to the console service (seconds)
+PRINT_FLUSH_INTERVAL = 0.05
+
 
 class FullDisplayApp(App):
     CSS = """
@@ -42,13 +45,19 @@ class FullDisplayApp(App):
         self._params = params
         self._pipeline_worker = None
         self._is_quitting = False
+        self._print_buffer: list[str] = []
 
-        self.app.begin_capture_print(self, stdout=True, stderr=True)
         self.log_view = ItemLogView()
         self.console_view = ConsoleLogView()
 
     def on_print(self, event: events.Print) -> None:
-        console_service.append(str(event.text))
+        # Buffer prints so bursts of output are added to the console as a single entry
+        self._print_buffer.append(str(event.text))
+
+    def _flush_prints(self) -> None:
+        buffer, self._print_buffer = self._print_buffer, []
+        if buffer:
+            console_service.append("".join(buffer))
 
     def compose(self) -> ComposeResult:
         with Vertical():
@@ -64,12 +73,25 @@ class FullDisplayApp(App):
                 yield self.console_view
 
     def on_mount(self) -> None:
+        self.begin_capture_print(self, stdout=True, stderr=True)
+        self.set_interval(PRINT_FLUSH_INTERVAL, self._flush_prints)
+
+        # Resolve widgets used when switching tabs once, rather than querying the DOM each switch
+        self._top_tabs = self.query_one('#top_tabs', Tabs)
+        self._pipeline_tab = self.query_one('#tab_pipeline', Tab)
+        self._pipeline_pane = self.query_one('#pane_pipeline', Horizontal)
+        self._console_pane = self.query_one('#pane_console', Horizontal)
+        self._tab_handlers = {
+            'tab_pipeline': self._show_pipeline,
+            'tab_console': self._show_console,
+        }
+
         if len(pipeline_service.pipelines) > 0:
             self._select_tab('tab_pipeline')
         else:
             self._select_tab('tab_console')
             # Hide pipeline tab until a pipeline starts
-            self.query_one('#tab_pipeline').display = False
+            self._pipeline_tab.display = False
 
         pipeline_service.subscribe("pipeline_started", {}, self._on_pipeline_started)
 
@@ -79,6 +101,10 @@ class FullDisplayApp(App):
             exit_on_error=True,
         )
 
+    def on_unmount(self) -> None:
+        self.end_capture_print(self)
+        self._flush_prints()
+
     def on_list_view_selected(self, event: ListView.Selected):
         # Only handle selections from the item tabs list
         source_list = event.list_view
@@ -117,21 +143,20 @@ class FullDisplayApp(App):
             if self._is_quitting or not self._params.get("no_exit", False):
                 self.exit()
 
-    def _cancel_pipeline(self, delay_seconds: float = 0.1) -> None:
+    def _cancel_pipeline(self) -> None:
         """
-        Cancel the pipeline worker if it is still running, after a short delay.
+        Cancel the pipeline worker if it is still running, once the UI has refreshed.
 
-        The delay gives Textual time to refresh the UI so the shutdown message is visible before any
-        potentially blocking cleanup work begins.
+        Waiting for the refresh ensures the shutdown message is visible before any potentially
+        blocking cleanup work begins, without adding a fixed delay to every quit.
         """
         worker = self._pipeline_worker
 
-        async def _cancel_after_delay() -> None:
-            await asyncio.sleep(delay_seconds)
+        def _cancel_after_refresh() -> None:
             if worker is not None and not worker.is_finished and worker.is_running:
                 worker.cancel()
 
-        self.call_later(_cancel_after_delay)
+        self.call_after_refresh(_cancel_after_refresh)
 
     async def action_quit(self) -> None:
         """
@@ -144,6 +169,7 @@ class FullDisplayApp(App):
         self._is_quitting = True
 
         if self._pipeline_worker is not None and not self._pipeline_worker.is_finished:
+            self._flush_prints()
             console_service.append(
                 "\nShutting down Docker containers... Please wait for cleanup to complete."
             )
@@ -154,22 +180,22 @@ class FullDisplayApp(App):
         self.exit()
 
     def _select_tab(self, tab_id: str) -> None:
-        top_tabs = self.query_one('#top_tabs')
-        top_tabs.active = tab_id
+        self._top_tabs.active = tab_id
         self._switch_tab(tab_id)
 
     def _switch_tab(self, tab_id: str) -> None:
-        pipeline_pane = self.query_one('#pane_pipeline')
-        console_pane = self.query_one('#pane_console')
-
-        if tab_id == 'tab_pipeline':
-            # Ensure the Pipeline tab itself is visible when selected, since it starts hidden
-            pipeline_tab = self.query_one('#tab_pipeline')
-            pipeline_tab.display = True
-
-            # Switch to the pipeline tab pane
-            pipeline_pane.display = True
-            console_pane.display = False
-        elif tab_id == 'tab_console':
-            pipeline_pane.display = False
-            console_pane.display = True
+        handler = self._tab_handlers.get(tab_id)
+        if handler:
+            handler()
+
+    def _show_pipeline(self) -> None:
+        # Ensure the Pipeline tab itself is visible when selected, since it starts hidden
+        self._pipeline_tab.display = True
+
+        # Switch to the pipeline tab pane
+        self._pipeline_pane.display = True
+        self._console_pane.display = False
+
+    def _show_console(self) -> None:
+        self._pipeline_pane.display = False
+        self._console_pane.display = True
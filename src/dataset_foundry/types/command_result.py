@@ -1,11 +1,12 @@
+from dataclasses import dataclass
 import logging
-from pydantic import BaseModel
 from typing import Any, List
 
 logger = logging.getLogger(__name__)
 
 
-class CommandResult(BaseModel):
+@dataclass(frozen=True, kw_only=True)
+class CommandResult:
     command: List[Any]
     returncode: int | None
     stdout: str
@@ -20,7 +21,9 @@ class CommandResult(BaseModel):
         Return a string representation of the command result. If debugging is enabled, include
         the stdout and stderr in the string.
         """
-        debugging = logger.isEnabledFor(logging.DEBUG)
+        return self._format(debugging=logger.isEnabledFor(logging.DEBUG))
+
+    def _format(self, debugging: bool) -> str:
         include_error = debugging or not self.success
         status = "SUCCESS" if self.success else "FAILED"
         stderr = f", stderr: {self.stderr}" if self.stderr else ""
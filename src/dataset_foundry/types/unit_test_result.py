@@ -1,10 +1,9 @@
-import logging
+from dataclasses import dataclass
 
 from .command_result import CommandResult
 
-logger = logging.getLogger(__name__)
-
 
+@dataclass(frozen=True, kw_only=True)
 class UnitTestResult(CommandResult):
     num_passed: int
     num_failed: int
@@ -17,12 +16,7 @@ class UnitTestResult(CommandResult):
     def success(self) -> bool:
         return self.returncode == 0 and self.num_passed > 0 and self.num_failed == 0
 
-    def __str__(self):
-        """
-        Return a string representation of the unit test result. If debugging is enabled, include
-        the stdout and stderr in the string.
-        """
-        debugging = logger.isEnabledFor(logging.DEBUG)
+    def _format(self, debugging: bool) -> str:
         include_error = debugging or not self.success
         status = "SUCCESS" if self.success else "FAILED"
         passed = f"{self.num_passed} passed" if self.num_passed > 0 else ""
@@ -0,0 +1,13 @@
+import pytest
+
+from dataset_foundry.displays.full.full_display import FullDisplay
+
+
+@pytest.fixture(scope="session")
+def shared_display():
+    """
+    A single `FullDisplay` shared across the test session. `FullDisplay` creates a new app for each
+    pipeline it runs, so it holds no state between tests.
+    """
+    display = FullDisplay()
+    yield display
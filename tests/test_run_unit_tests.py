@@ -0,0 +1,145 @@
+"""
+Tests for parsing sandboxed unit test output in the run_unit_tests action.
+"""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from dataset_foundry.actions.item.run_unit_tests import (
+    _parse_sandbox_result,
+    _split_stream,
+    run_unit_tests,
+)
+from dataset_foundry.core.dataset_item import DatasetItem
+from dataset_foundry.utils.docker.sandbox_runner import SandboxResult
+
+
+def _sandbox_result(stdout: str, stderr: str = "", exit_code: int = 0) -> SandboxResult:
+    return SandboxResult(
+        exit_code=exit_code,
+        stdout=stdout,
+        stderr=stderr,
+        logs="",
+        container_id="test-container-id",
+    )
+
+
+class TestSplitStream:
+    """Test splitting a stream into setup and pytest sections."""
+
+    def test_no_setup_markers(self):
+        """Output without markers is treated entirely as pytest output."""
+        assert _split_stream("\n1 passed\n") == ("1 passed", "", None)
+
+    def test_setup_markers(self):
+        """Content between the markers is setup output, content after is pytest output."""
+        output = "::setup:start::\ninstalling\n::setup:end:0::\n1 passed\n"
+
+        assert _split_stream(output) == ("1 passed", "installing", 0)
+
+    def test_setup_failure_code(self):
+        """The setup exit code is parsed from the end marker."""
+        output = "::setup:start::\nerror\n::setup:end:12::\n"
+
+        assert _split_stream(output) == ("", "error", 12)
+
+    def test_missing_end_marker(self):
+        """A start marker without an end marker treats the remainder as setup output."""
+        output = "::setup:start::\ninstalling\n"
+
+        assert _split_stream(output) == ("", "installing", -1)
+
+    def test_malformed_end_marker(self):
+        """An end marker without a valid exit code is not treated as the end of setup."""
+        output = "::setup:start::\n::setup:end:x::\n::setup:end:3::\n1 passed"
+
+        assert _split_stream(output) == ("1 passed", "::setup:end:x::", 3)
+
+
+class TestParseSandboxResult:
+    """Test parsing a sandbox result into pytest and setup results."""
+
+    def test_setup_and_pytest_output(self):
+        """Setup and pytest output are split across both streams."""
+        result = _sandbox_result(
+            stdout="::setup:start::\nsetup out\n::setup:end:0::\n1 passed\n",
+            stderr="::setup:start::\nsetup err\n::setup:end:0::\npytest err\n",
+        )
+
+        pytest_result, setup_result = _parse_sandbox_result(result)
+
+        assert pytest_result.returncode == 0
+        assert pytest_result.stdout == "1 passed"
+        assert pytest_result.stderr == "pytest err"
+        assert setup_result.returncode == 0
+        assert setup_result.stdout == "setup out"
+        assert setup_result.stderr == "setup err"
+
+    def test_setup_failed(self):
+        """When setup fails, pytest never ran and the setup result carries the exit code."""
+        result = _sandbox_result(
+            stdout="::setup:start::\nfailed\n::setup:end:1::\n",
+            exit_code=1,
+        )
+
+        pytest_result, setup_result = _parse_sandbox_result(result)
+
+        assert pytest_result.returncode is None
+        assert setup_result.returncode == 1
+        assert setup_result.stdout == "failed"
+
+    def test_no_setup_markers(self):
+        """Without setup markers, all output is pytest output and there is no setup result."""
+        result = _sandbox_result(stdout="\n1 passed\n", stderr="warning\n", exit_code=0)
+
+        pytest_result, setup_result = _parse_sandbox_result(result)
+
+        assert pytest_result.returncode == 0
+        assert pytest_result.stdout == "1 passed"
+        assert pytest_result.stderr == "warning"
+        assert setup_result is None
+
+    def test_no_output(self):
+        """Without any output, pytest is treated as never having run."""
+        result = _sandbox_result(stdout="", stderr="", exit_code=1)
+
+        pytest_result, setup_result = _parse_sandbox_result(result)
+
+        assert pytest_result.returncode is None
+        assert setup_result.returncode == 1
+
+
+class TestRunUnitTests:
+    """Test the run_unit_tests action."""
+
+    @pytest.mark.asyncio
+    async def test_max_concurrent_sandboxes(self, tmp_path):
+        """No more than `max_concurrent_sandboxes` sandboxes run at once across items."""
+        running = 0
+        max_running = 0
+
+        async def run(**kwargs):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return _sandbox_result(stdout="1 passed")
+
+        sandbox_runner = MagicMock()
+        sandbox_runner.run = run
+        context = MagicMock()
+        context.params = { "max_concurrent_sandboxes": 2 }
+        action = run_unit_tests("test_example.py", dir=str(tmp_path), sandbox="python")
+        items = [DatasetItem(str(index), {}) for index in range(5)]
+
+        with patch(
+            "dataset_foundry.actions.item.run_unit_tests._get_sandbox_runner",
+            return_value=sandbox_runner,
+        ):
+            await asyncio.gather(*(action(item, context) for item in items))
+
+        assert max_running == 2
+        assert all(item.data["test_result"].num_passed == 1 for item in items)